@@ -4,24 +4,302 @@ __author__ = "Joel McCune (https://github.com/knu2xs)"
 __license__ = "Apache 2.0"
 __copyright__ = "Copyright 2023 by Joel McCune (https://github.com/knu2xs)"
 
-__all__ = ["send_email", "send_gmail", "send_sms", "send_pushover"]
-
+__all__ = [
+    "SendSession",
+    "send_email",
+    "send_email_many",
+    "send_gmail",
+    "send_sms",
+    "send_sms_async",
+    "send_pushover",
+    "send_pushover_many",
+    "send_pushover_many_threaded",
+]
+
+import atexit
 import importlib.util
 import logging
 import os
 import re
 import smtplib
+import threading
+import time
+from email.generator import BytesGenerator
 from email.mime.text import MIMEText
-from typing import Optional, Union
+from email.policy import compat32
+from io import BytesIO
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+from urllib.parse import urlencode
+
+# asyncio, aiohttp, requests and the Azure SMS SDK are imported when first used, so importing only to send email
+# stays fast
+if TYPE_CHECKING:
+    import asyncio
+
+    import aiohttp
+    import requests
+    from azure.communication.sms import SmsClient, SmsSendResult
+
+# whether environment variables have been loaded from a .env file, deferred until first needed
+_dotenv_loaded = False
+_dotenv_lock = threading.Lock()
+
+# environment variable values, read once per process since credentials do not change between sends
+_ENV_UNSET = object()
+_env_cache: dict[str, Optional[str]] = {}
+
+
+def _maybe_load_dotenv() -> None:
+    """
+    If in development environment, load environment variables from .env file the first time any are needed. Set the
+    ``PY_MESSAGE_LOAD_DOTENV`` environment variable to ``0`` to skip this.
+    """
+    global _dotenv_loaded
+
+    if _dotenv_loaded:
+        return
+
+    # hold the lock until loading finishes, so other threads do not read the environment before it is loaded
+    with _dotenv_lock:
+        if _dotenv_loaded:
+            return
+
+        # skip if explicitly turned off, such as in production where variables are already set
+        load_enabled = os.environ.get("PY_MESSAGE_LOAD_DOTENV", "1") == "1"
+
+        if load_enabled and importlib.util.find_spec("dotenv"):
+            from dotenv import load_dotenv, find_dotenv
+
+            load_dotenv(find_dotenv())
+
+        _dotenv_loaded = True
+
+
+def _env(key: str) -> Optional[str]:
+    """Get an environment variable, only reading it on first use. Clear ``_env_cache`` to read it again."""
+    value = _env_cache.get(key, _ENV_UNSET)
+    if value is _ENV_UNSET:
+        _maybe_load_dotenv()
+        value = os.environ.get(key)
+        _env_cache[key] = value
+    return value
+
+
+# translation table deleting every ASCII character other than digits, and pattern stripping non-digits from phone
+# numbers containing other characters, both built once since they run for every recipient
+_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+# SMS client and sending number, lazily created once and reused for all subsequent sends
+_sms_client: Optional["SmsClient"] = None
+_azure_from: Optional[str] = None
+
+# maximum number of recipients sent in a single SMS request
+_SMS_BATCH_SIZE = 100
+
+# authenticated SMTP connections keyed by (host, port, sender), reused until idle too long or sent too many messages
+_SMTP_IDLE_TIMEOUT = 100
+_SMTP_MAX_MESSAGES = 100
+_smtp_pool: dict[tuple[str, int, str], tuple[smtplib.SMTP_SSL, float, int]] = {}
+_smtp_pool_lock = threading.Lock()
+
+# pattern for line endings in email bodies
+_EOL_RE = re.compile(r"\r\n|\n|\r")
+
+# policy used when writing MIMEText messages, matching what smtplib sends
+_SMTP_POLICY = compat32.clone(linesep="\r\n")
+
+# Pushover requests are sent using the shared HTTP session in ``_http``
+_PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
+_PUSHOVER_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# seconds to wait on a Pushover request, and retries with backoff for rate limiting and server errors
+_PUSHOVER_TIMEOUT = 10
+_PUSHOVER_RETRIES = 3
+_PUSHOVER_BACKOFF = 0.3
+_PUSHOVER_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _close_smtp(smtp_server: smtplib.SMTP_SSL) -> None:
+    """Close an SMTP connection, ignoring errors if the connection has already dropped."""
+    try:
+        smtp_server.quit()
+    except (smtplib.SMTPException, OSError):
+        smtp_server.close()
+
+
+def _close_smtp_pool() -> None:
+    """Close all pooled SMTP connections."""
+    with _smtp_pool_lock:
+        entries = list(_smtp_pool.values())
+        _smtp_pool.clear()
+
+    for smtp_server, _, _ in entries:
+        _close_smtp(smtp_server)
+
+
+atexit.register(_close_smtp_pool)
+
+
+def _connect_smtp(
+    smtp_host: str, smtp_port: int, sender: str, password: str
+) -> smtplib.SMTP_SSL:
+    """Connect to the SMTP server using SSL, and login using the sender's credentials."""
+    smtp_server = smtplib.SMTP_SSL(smtp_host, smtp_port)
+    smtp_server.login(sender, password)
+
+    return smtp_server
+
+
+def _get_smtp(
+    smtp_host: str, smtp_port: int, sender: str, password: str
+) -> tuple[smtplib.SMTP_SSL, int]:
+    """
+    Take a live, authenticated SMTP connection out of the pool, connecting and logging in if none is usable. Returns
+    the connection along with the count of messages already sent over it.
+    """
+    # take the connection out of the pool so no other thread uses it at the same time
+    with _smtp_pool_lock:
+        entry = _smtp_pool.pop((smtp_host, smtp_port, sender), None)
 
-import requests
-from azure.communication.sms import SmsClient, SmsSendResult
+    if entry is not None:
+        smtp_server, last_used, sent_count = entry
 
-# if in development environment, load environment variables from .env file
-if importlib.util.find_spec("dotenv"):
-    from dotenv import load_dotenv, find_dotenv
+        # retire connections idle too long or used for too many messages
+        if (
+            time.monotonic() - last_used > _SMTP_IDLE_TIMEOUT
+            or sent_count >= _SMTP_MAX_MESSAGES
+        ):
+            _close_smtp(smtp_server)
 
-    load_dotenv(find_dotenv())
+        # ensure the server has not dropped the connection
+        else:
+            try:
+                if smtp_server.noop()[0] == 250:
+                    logging.debug(f"Reusing pooled SMTP connection to {smtp_host}.")
+                    return smtp_server, sent_count
+            except (smtplib.SMTPException, OSError):
+                pass
+
+            _close_smtp(smtp_server)
+
+    return _connect_smtp(smtp_host, smtp_port, sender, password), 0
+
+
+def _release_smtp(
+    smtp_host: str,
+    smtp_port: int,
+    sender: str,
+    smtp_server: smtplib.SMTP_SSL,
+    sent_count: int,
+) -> None:
+    """Return an SMTP connection to the pool, closing any pooled connections which have gone idle too long."""
+    now = time.monotonic()
+    stale = []
+
+    with _smtp_pool_lock:
+        # close expired connections
+        for key, (pooled_server, last_used, _) in list(_smtp_pool.items()):
+            if now - last_used > _SMTP_IDLE_TIMEOUT:
+                stale.append(pooled_server)
+                del _smtp_pool[key]
+
+        # if another thread already returned a connection for the same key, keep only one
+        key = (smtp_host, smtp_port, sender)
+        if key in _smtp_pool:
+            stale.append(smtp_server)
+        else:
+            _smtp_pool[key] = (smtp_server, now, sent_count)
+
+    for pooled_server in stale:
+        _close_smtp(pooled_server)
+
+
+def _build_mime_email(sender: str, to: str, body: str, subject: Optional[str]) -> bytes:
+    """Build an email message using MIMEText, handling encoding of non-ASCII text."""
+    # Create a MIMEText object with the body of the email.
+    msg = MIMEText(body)
+
+    # Set the sender's email.
+    msg["From"] = sender
+
+    # if a subject is provided, add it
+    if subject is not None:
+        msg["Subject"] = subject
+
+    # Set the comma separated recipients.
+    msg["To"] = to
+
+    # Write the message directly as bytes with CRLF line endings, ready to send as is.
+    buffer = BytesIO()
+    BytesGenerator(buffer, mangle_from_=False, policy=_SMTP_POLICY).flatten(msg)
+
+    return buffer.getvalue()
+
+
+def _build_simple_email(
+    sender: str, to: str, body: str, subject: Optional[str]
+) -> Optional[bytes]:
+    """
+    Build a plain ASCII email message directly as bytes, bypassing the overhead of MIMEText. Returns ``None`` if
+    MIMEText would do more than write the text as is, such as encoding non-ASCII text or folding long headers.
+    """
+    header_lines = [f"From: {sender}", f"To: {to}"]
+    if subject is not None:
+        header_lines.insert(1, f"Subject: {subject}")
+
+    # headers must be single lines of ASCII text short enough MIMEText would not fold them
+    for line in header_lines:
+        if (
+            not line.isascii()
+            or "\r" in line
+            or "\n" in line
+            or len(line) > _SMTP_POLICY.max_line_length
+        ):
+            return None
+
+    # the body must be ASCII text, sent with CRLF line endings
+    if not body.isascii():
+        return None
+
+    # assemble the same headers MIMEText would use for ASCII text
+    email = (
+        'Content-Type: text/plain; charset="us-ascii"\r\n'
+        "MIME-Version: 1.0\r\n"
+        "Content-Transfer-Encoding: 7bit\r\n"
+        + "".join(f"{line}\r\n" for line in header_lines)
+        + "\r\n"
+        + "\r\n".join(_EOL_RE.split(body))
+    )
+
+    return email.encode("ascii")
+
+
+def _send_email_message(
+    smtp_server: smtplib.SMTP_SSL,
+    sender: str,
+    recipients: Union[str, list[str]],
+    body: str,
+    subject: Optional[str] = None,
+) -> None:
+    """Send a single email over an authenticated SMTP connection."""
+    # use a single recipient as is, since sendmail also accepts a single address, otherwise join the recipients into
+    # a single string separated by commas
+    to = recipients if isinstance(recipients, str) else ", ".join(recipients)
+
+    # Build the email message as bytes, directly for plain ASCII messages, or using MIMEText otherwise.
+    msg = _build_simple_email(sender, to, body, subject)
+    if msg is None:
+        msg = _build_mime_email(sender, to, body, subject)
+
+    # Send the email. The sendmail function requires the sender's email, the list of recipients, and the email
+    # message as bytes.
+    smtp_server.sendmail(sender, recipients, msg)
+
+    # Print a message to console after successfully sending the email.
+    logging.debug(f"Message with text {body} sent to {to}.")
 
 
 def send_email(
@@ -49,35 +327,65 @@ def send_email(
         subject: Subject of the email.
         smtp_port: SMTP port for the SMTP server, defaults to 465.
     """
-    # if recipients is single string, convert to list
-    if isinstance(recipients, str):
-        recipients = [recipients]
+    # send the single message, reusing a pooled connection if available
+    send_email_many(
+        smtp_host=smtp_host,
+        sender=sender,
+        password=password,
+        messages=[(recipients, body, subject)],
+        smtp_port=smtp_port,
+    )
 
-    # Create a MIMEText object with the body of the email.
-    msg = MIMEText(body)
+    return
 
-    # Set the sender's email.
-    msg["From"] = sender
 
-    # if a subject is provided, add it
-    if subject is not None:
-        msg["Subject"] = subject
+def send_email_many(
+    smtp_host: str,
+    sender: str,
+    password: str,
+    messages: list[tuple[Union[str, list[str]], str, Optional[str]]],
+    smtp_port: Optional[int] = 465,
+) -> None:
+    """
+    Send multiple simple messages to email over a single SMTP connection, only connecting and logging in once.
 
-    # Join the list of recipients into a single string separated by commas.
-    msg["To"] = ", ".join(recipients)
+    .. note::
+
+        Authenticated connections are kept in a pool keyed by host, port and sender, so later calls to
+        ``send_email`` or ``send_email_many`` reuse the connection rather than connecting and logging in again.
+        Pooled connections are closed after being idle for 100 seconds or sending 100 messages.
+
+    Args:
+        smtp_host: SMTP host, such as ``smtp.gmail.com``.
+        sender: Email address of the sender.
+        password: Application password of the sender.
+        messages: List of ``(recipients, body, subject)`` tuples, one for each message to send. The subject can be
+          ``None``.
+        smtp_port: SMTP port for the SMTP server, defaults to 465.
+    """
+    # get an authenticated connection to the SMTP server, reusing a pooled one if available
+    smtp_server, sent_count = _get_smtp(smtp_host, smtp_port, sender, password)
 
-    # Connect to Gmail's SMTP server using SSL.
-    with smtplib.SMTP_SSL(smtp_host, smtp_port) as smtp_server:
+    try:
+        for recipients, body, subject in messages:
 
-        # Login to the SMTP server using the sender's credentials.
-        smtp_server.login(sender, password)
+            # retire the connection once it has sent as many messages as allowed, and continue on another
+            if sent_count >= _SMTP_MAX_MESSAGES:
+                _close_smtp(smtp_server)
+                smtp_server, sent_count = _get_smtp(
+                    smtp_host, smtp_port, sender, password
+                )
 
-        # Send the email. The sendmail function requires the sender's email, the list of recipients, and the email
-        # message as a string.
-        smtp_server.sendmail(sender, recipients, msg.as_string())
+            _send_email_message(smtp_server, sender, recipients, body, subject)
+            sent_count += 1
 
-    # Print a message to console after successfully sending the email.
-    logging.debug(f"Message with text {body} sent to {msg['To']}.")
+    # do not return a connection in an unknown state to the pool
+    except Exception:
+        _close_smtp(smtp_server)
+        raise
+
+    # keep the connection for reuse by later sends
+    _release_smtp(smtp_host, smtp_port, sender, smtp_server, sent_count)
 
     return
 
@@ -110,8 +418,8 @@ def send_gmail(
 
     # otherwise, try to retrieve credentials from environment variables
     else:
-        sender = os.environ.get("GMAIL_USERNAME")
-        password = os.environ.get("GMAIL_PASSWORD")
+        sender = _env("GMAIL_USERNAME")
+        password = _env("GMAIL_PASSWORD")
 
     # ensure some credentials are found
     if sender is None or password is None:
@@ -136,32 +444,202 @@ def send_gmail(
 
 def _validate_phone_number(phone_number: str) -> str:
     """Ensure and clean up phone number string for sending SMS messages, ``+133344455555``."""
-    # pluck out all the numbers
-    matches = re.findall(r"\d+", phone_number)
+    # strip out everything but the numbers in a single pass
+    digits = phone_number.translate(_NON_DIGITS)
 
-    # combine all the numbers
-    if len(matches):
-        phone_number = "".join(matches)
+    # fall back to the pattern if characters outside ASCII, such as a non-breaking space, remain
+    if not (digits.isascii() and digits.isdigit()):
+        digits = _NON_DIGITS_RE.sub("", phone_number)
 
     # if the phone number is not 10 to 12 digits, cannot use
-    if (len(phone_number) < 10) or (len(phone_number) > 12):
+    if (len(digits) < 10) or (len(digits) > 12):
         raise ValueError(
             f"""The phone number provided "{phone_number}", is not between 10 and 12 digits."""
         )
 
-    # if does not include the 1 US country code, add it
-    elif len(phone_number) == 10:
-        phone_number = "1" + phone_number
+    # add the plus prefix, and if does not include the 1 US country code, add it
+    return f"+1{digits}" if len(digits) == 10 else f"+{digits}"
+
+
+def _validate_phone_numbers(phone_numbers: Iterable[str]) -> list[str]:
+    """Ensure and clean up many phone numbers at once, inlining ``_validate_phone_number`` for plain ASCII input."""
+    validated = []
+    for phone_number in phone_numbers:
+        digits = phone_number.translate(_NON_DIGITS)
+        digit_count = len(digits)
+
+        # defer anything not reduced to 10 to 12 ASCII digits to the single number path for handling or error
+        if 10 <= digit_count <= 12 and digits.isascii() and digits.isdigit():
+            validated.append("+1" + digits if digit_count == 10 else "+" + digits)
+        else:
+            validated.append(_validate_phone_number(phone_number))
+
+    return validated
+
 
-    # add the plus prefix
-    phone_number = "+" + phone_number
+def _create_sms_client(session: "requests.Session") -> "SmsClient":
+    """Create an Azure SMS client from the connection string, sending requests using the provided HTTP session."""
+    from azure.communication.sms import SmsClient
+    from azure.core.pipeline.transport import RequestsTransport
 
-    return phone_number
+    # load the SMS connection string from environment variables
+    azure_sms_connection_string = _env("AZURE_SMS_CONNECTION_STRING")
+
+    if azure_sms_connection_string is None:
+        raise EnvironmentError(
+            "Cannot load Azure SMS connection string from environment variables."
+        )
+
+    # create the client to use for sending messages
+    return SmsClient.from_connection_string(
+        azure_sms_connection_string,
+        transport=RequestsTransport(session=session, session_owner=False),
+    )
+
+
+def _get_sms_client() -> "SmsClient":
+    """Get the Azure SMS client, creating it on first use with the shared HTTP session."""
+    global _sms_client
+
+    if _sms_client is None:
+        from ._http import SESSION
+
+        _sms_client = _create_sms_client(SESSION)
+
+    return _sms_client
+
+
+def _get_azure_from() -> str:
+    """Get the formatted Azure SMS number used for sending, reading it from the environment on first use."""
+    global _azure_from
+
+    if _azure_from is None:
+        # get the SMS number used for sending messages
+        azure_sms_number = _env("AZURE_SMS_NUMBER")
+
+        if azure_sms_number is None:
+            raise EnvironmentError(
+                "Cannot load Azure SMS number from environment variables."
+            )
+
+        # format the azure phone number, the number used for sending
+        _azure_from = _validate_phone_number(azure_sms_number)
+
+    return _azure_from
+
+
+def _get_sms_recipients(recipients: Optional[Union[str, list[str]]]) -> list[str]:
+    """Get the formatted list of phone numbers to send to, falling back to the ``SMS_NUMBER`` environment variable."""
+    # if recepients not provided, try to read from environment variable
+    if recipients is None:
+        recipients = _env("SMS_NUMBER")
+
+    # if still do not have a sms number, cannot send a message
+    if recipients is None:
+        raise ValueError("Please provide recipient phone number(s).")
+
+    # format the phone numbers to send to
+    if isinstance(recipients, str):
+        recipients = [_validate_phone_number(recipients)]
+    else:
+        recipients = _validate_phone_numbers(recipients)
+
+    return recipients
+
+
+def _log_sms_responses(body: str, sms_responses: "list[SmsSendResult]") -> None:
+    """Ensure all messages were successful, and notify if not."""
+    for resp in sms_responses:
+        if not resp.successful:
+            logging.error(
+                f"""Encountered error while sending SMS message to "{resp.to}": {resp.error_message}"""
+            )
+        else:
+            logging.debug(f"""SMS Message "{body}" successfully sent to "{resp.to}".""")
+
+
+async def _send_sms_batches(
+    sms_client: "SmsClient", azure_sms_number: str, body: str, recipients: list[str]
+) -> "list[SmsSendResult]":
+    """Send an SMS message to formatted phone numbers, sending each batch of recipients concurrently."""
+    import asyncio
+
+    # send each batch of recipients in a worker thread, since the client blocks while waiting on the response
+    batch_responses = await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                sms_client.send,
+                from_=azure_sms_number,
+                to=recipients[idx : idx + _SMS_BATCH_SIZE],
+                message=body,
+            )
+            for idx in range(0, len(recipients), _SMS_BATCH_SIZE)
+        ]
+    )
+
+    # combine the responses from all the batches
+    sms_responses = [resp for responses in batch_responses for resp in responses]
+
+    _log_sms_responses(body, sms_responses)
+
+    return sms_responses
+
+
+def _send_sms(
+    sms_client: "SmsClient", azure_sms_number: str, body: str, recipients: list[str]
+) -> "list[SmsSendResult]":
+    """Send an SMS message to formatted phone numbers, sending batches concurrently if there is more than one."""
+    # if more than one batch, send the batches concurrently unless already running inside an event loop
+    if len(recipients) > _SMS_BATCH_SIZE:
+        import asyncio
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                _send_sms_batches(sms_client, azure_sms_number, body, recipients)
+            )
+
+    # use the client to send the message, one batch after another
+    sms_responses = []
+    for idx in range(0, len(recipients), _SMS_BATCH_SIZE):
+        sms_responses.extend(
+            sms_client.send(
+                from_=azure_sms_number,
+                to=recipients[idx : idx + _SMS_BATCH_SIZE],
+                message=body,
+            )
+        )
+
+    _log_sms_responses(body, sms_responses)
+
+    return sms_responses
+
+
+async def send_sms_async(
+    body: str, recipients: Optional[Union[str, list[str]]] = None
+) -> "list[SmsSendResult]":
+    """
+    Send text messages to phone numbers using
+    `Azure Communication Services' SMS SDK <https://learn.microsoft.com/en-us/azure/communication-services/quickstarts/sms/send>`_,
+    splitting large lists of recipients into batches of 100 sent concurrently.
+
+    Args:
+        body: Text message to send.
+        recipients: Single phone number or list of phone numbers to send to.
+    """
+    # format the phone numbers to send to
+    recipients = _get_sms_recipients(recipients)
+
+    # use the cached client and number used for sending messages
+    return await _send_sms_batches(
+        _get_sms_client(), _get_azure_from(), body, recipients
+    )
 
 
 def send_sms(
     body: str, recipients: Optional[Union[str, list[str]]] = None
-) -> list[SmsSendResult]:
+) -> "list[SmsSendResult]":
     """
     Send text messages to phone numbers using
     `Azure Communication Services' SMS SDK <https://learn.microsoft.com/en-us/azure/communication-services/quickstarts/sms/send>`_.
@@ -177,64 +655,95 @@ def send_sms(
         body: Text message to send.
         recipients: Single phone number or list of phone numbers to send to.
     """
-    # if recepients not provided, try to read from environment variable
-    if recipients is None:
-        recipients = os.environ.get("SMS_NUMBER")
+    # format the phone numbers to send to
+    recipients = _get_sms_recipients(recipients)
 
-    # if still do not have a sms number, cannot send a message
-    if recipients is None:
-        raise ValueError("Please provide recipient phone number(s).")
+    # use the cached client and number used for sending messages
+    return _send_sms(_get_sms_client(), _get_azure_from(), body, recipients)
 
-    # format the phone numbers to send to
-    if isinstance(recipients, str):
-        recipients = _validate_phone_number(recipients)
+
+def _get_pushover_credentials(
+    api_token: Optional[str] = None, user_key: Optional[str] = None
+) -> tuple[str, str]:
+    """Get the Pushover API token and user key, falling back to environment variables if not provided."""
+    if user_key is None:
+        user_key = _env("PUSHOVER_USER_KEY")
+        logging.debug("Using Pushover user key from environment variables.")
     else:
-        recipients = [_validate_phone_number(ph) for ph in recipients]
+        logging.debug("Using Pushover user key provided via input parameter.")
 
-    # load the SMS connection string from environment variables
-    azure_sms_connection_string = os.environ.get("AZURE_SMS_CONNECTION_STRING")
+    if api_token is None:
+        api_token = _env("PUSHOVER_API_KEY")
+        logging.debug(f"Using Pushover API token from environment variables.")
+    else:
+        logging.debug(f"Using Pushover API token provided via input parameter.")
 
-    if azure_sms_connection_string is None:
-        raise EnvironmentError(
-            "Cannot load Azure SMS connection string from environment variables."
-        )
+    return api_token, user_key
 
-    # get the SMS number used for sending messages
-    azure_sms_number = os.environ.get("AZURE_SMS_NUMBER")
 
-    if azure_sms_number is None:
-        raise EnvironmentError(
-            "Cannot load Azure SMS number from environment variables."
-        )
+def _get_pushover_payload(message: str, api_token: str, user_key: str) -> bytes:
+    """
+    Build the form encoded payload for a Pushover message request. Encoding once up front means retries replay the
+    same bytes rather than encoding the form again.
+    """
+    payload = {
+        "token": api_token,
+        "user": user_key,
+        "message": message,
+        "sound": "bugle",
+    }
 
-    # format the azure phone number, the number used for sending
-    azure_sms_number = _validate_phone_number(azure_sms_number)
+    # like requests, leave out any values not provided
+    payload = {key: val for key, val in payload.items() if val is not None}
 
-    # create the client to use for sending messages
-    sms_client: SmsClient = SmsClient.from_connection_string(
-        azure_sms_connection_string
+    return urlencode(payload).encode("ascii")
+
+
+def _post_pushover_message(
+    session: "requests.Session",
+    message: str,
+    api_token: Optional[str] = None,
+    user_key: Optional[str] = None,
+) -> "requests.Response":
+    """Send a Pushover notification using the provided HTTP session."""
+    # try to retrieve credentials from environment variables
+    api_token, user_key = _get_pushover_credentials(api_token, user_key)
+
+    # format parameters
+    payload = _get_pushover_payload(message, api_token, user_key)
+
+    # make post call to submit message send request
+    res = session.post(
+        _PUSHOVER_URL,
+        headers=_PUSHOVER_HEADERS,
+        data=payload,
+        timeout=_PUSHOVER_TIMEOUT,
     )
 
-    # use the client to send the message
-    sms_responses = sms_client.send(from_=azure_sms_number, to=recipients, message=body)
+    # handle response if an error is encountered
+    if res.status_code != 200:
 
-    # ensure all messages were successful, and notify if not
-    for resp in sms_responses:
-        if not resp.successful:
-            logging.error(
-                f"""Encountered error while sending SMS message to "{resp.to}": {resp.error_message}"""
-            )
-        else:
-            logging.debug(f"""SMS Message "{body}" successfully sent to "{resp.to}".""")
+        # error pages from proxies may be empty or not JSON, so do not let one fail a batch of sends
+        try:
+            error = res.json().get("error")
+        except (ValueError, AttributeError):
+            error = res.reason
 
-    return sms_responses
+        logging.error(
+            f"""Pushover API encountered an error, returned status code {res.status_code}: {error}"""
+        )
+    else:
+        logging.debug("Message successfully sent via Pushover.")
+
+    # provide the response back, which can be handled if necessary
+    return res
 
 
 def send_pushover(
     message: str,
     api_token: Optional[str] = None,
     user_key: Optional[str] = None,
-) -> requests.Response:
+) -> "requests.Response":
     """
     Send notifications using the `Pushover <https://pushover.net>`_ platform.
 
@@ -251,39 +760,235 @@ def send_pushover(
         user_key: Pushover user key. If not provided, will try to retrieve from ``PUSHOVER_USER_KEY`` environment
           variable.
     """
-    # try to retrieve credentials from environment variables
-    if user_key is None:
-        user_key = os.environ.get("PUSHOVER_USER_KEY")
-        logging.debug("Using Pushover user key from environment variables.")
-    else:
-        logging.debug("Using Pushover user key provided via input parameter.")
+    from ._http import SESSION
 
-    if api_token is None:
-        api_token = os.environ.get("PUSHOVER_API_KEY")
-        logging.debug(f"Using Pushover API token from environment variables.")
-    else:
-        logging.debug(f"Using Pushover API token provided via input parameter.")
+    # make the request using the shared HTTP session
+    return _post_pushover_message(SESSION, message, api_token, user_key)
 
-    # format parameters
-    url = "https://api.pushover.net/1/messages.json"
-    payload = {
-        "token": api_token,
-        "user": user_key,
-        "message": message,
-        "sound": "bugle",
-    }
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-    # make post call to submit message send request
-    res = requests.post(url, headers=headers, data=payload)
+def send_pushover_many_threaded(
+    messages: list[str],
+    api_token: Optional[str] = None,
+    user_key: Optional[str] = None,
+    max_workers: int = 8,
+) -> "list[requests.Response]":
+    """
+    Send multiple notifications concurrently using the `Pushover <https://pushover.net>`_ platform, using a pool of
+    threads rather than requiring ``asyncio`` and ``aiohttp``.
+
+    Args:
+        messages: Text messages to send.
+        api_token: Pushover API token. If not provided, will try to retrieve from ``PUSHOVER_API_KEY`` environment
+          variable.
+        user_key: Pushover user key. If not provided, will try to retrieve from ``PUSHOVER_USER_KEY`` environment
+          variable.
+        max_workers: Maximum number of requests to have in flight at once, to respect Pushover rate limits.
+    """
+    # try to retrieve credentials from environment variables once, rather than in every thread
+    api_token, user_key = _get_pushover_credentials(api_token, user_key)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # submit each message to the shared session from a worker thread, and collect the responses in order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(send_pushover, msg, api_token=api_token, user_key=user_key)
+            for msg in messages
+        ]
+        responses = [future.result() for future in futures]
+
+    return responses
+
+
+async def _post_pushover(
+    session: "aiohttp.ClientSession", semaphore: "asyncio.Semaphore", payload: bytes
+) -> dict:
+    """
+    Submit a single Pushover message request, waiting on the semaphore to limit concurrent requests. Rate limiting
+    and server errors are retried with backoff, matching the adapter used for synchronous requests.
+    """
+    import asyncio
+
+    async with semaphore:
+        for attempt in range(_PUSHOVER_RETRIES + 1):
+            async with session.post(
+                _PUSHOVER_URL, headers=_PUSHOVER_HEADERS, data=payload
+            ) as res:
+                status = res.status
+
+                # error pages from proxies may be empty or not JSON, so do not let one fail the whole batch
+                try:
+                    res_json = await res.json(content_type=None)
+                except ValueError:
+                    res_json = None
+
+                if not isinstance(res_json, dict):
+                    res_json = {"status": 0, "error": res.reason}
+
+            # wait before retrying, holding the semaphore so other requests also back off
+            if status in _PUSHOVER_RETRY_STATUSES and attempt < _PUSHOVER_RETRIES:
+                await asyncio.sleep(_PUSHOVER_BACKOFF * 2**attempt)
+            else:
+                break
 
     # handle response if an error is encountered
-    if res.status_code != requests.codes.ok:
+    if status != 200:
         logging.error(
-            f"""Pushover API encountered an error, returned status code {res.status_code}: {res.json().get("error")}"""
+            f"""Pushover API encountered an error, returned status code {status}: {res_json.get("error")}"""
         )
     else:
         logging.debug("Message successfully sent via Pushover.")
 
-    # provide the response back, which can be handled if necessary
-    return res
+    return res_json
+
+
+async def send_pushover_many(
+    messages: list[str],
+    api_token: Optional[str] = None,
+    user_key: Optional[str] = None,
+    max_concurrency: int = 8,
+) -> list[dict]:
+    """
+    Send multiple notifications concurrently using the `Pushover <https://pushover.net>`_ platform.
+
+    .. note::
+
+        This requires `aiohttp <https://docs.aiohttp.org>`_ to be installed, and must be awaited, such as
+        ``asyncio.run(send_pushover_many(messages))``.
+
+    Args:
+        messages: Text messages to send.
+        api_token: Pushover API token. If not provided, will try to retrieve from ``PUSHOVER_API_KEY`` environment
+          variable.
+        user_key: Pushover user key. If not provided, will try to retrieve from ``PUSHOVER_USER_KEY`` environment
+          variable.
+        max_concurrency: Maximum number of requests to have in flight at once, to respect Pushover rate limits.
+          Requests rate limited or hitting server errors are retried up to 3 times with backoff.
+    """
+    import asyncio
+
+    import aiohttp
+
+    # try to retrieve credentials from environment variables
+    api_token, user_key = _get_pushover_credentials(api_token, user_key)
+
+    # limit the number of concurrent requests both at the connection and request level
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=max_concurrency, ttl_dns_cache=300)
+
+    # submit all the message requests over a single session, and collect the responses in order
+    timeout = aiohttp.ClientTimeout(total=_PUSHOVER_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        responses = await asyncio.gather(
+            *[
+                _post_pushover(
+                    session, semaphore, _get_pushover_payload(msg, api_token, user_key)
+                )
+                for msg in messages
+            ]
+        )
+
+    return list(responses)
+
+
+class SendSession:
+    """
+    Context manager keeping SMTP, Pushover and Azure SMS connections open across many sends, so connecting,
+    authenticating and importing dependencies only happens once for the life of the session.
+
+    .. code-block:: python
+
+        with py_message.SendSession() as session:
+            for item in items:
+                session.send_email("smtp.gmail.com", sender, password, recipient, f"Processed {item}.")
+                session.send_pushover(f"Processed {item}.")
+
+    Each connection is opened the first time it is needed, and all are closed when the context exits. The methods
+    take the same arguments as the module functions of the same name.
+    """
+
+    def __init__(self) -> None:
+        self._smtp_connections: dict[tuple[str, int, str], smtplib.SMTP_SSL] = {}
+        self._http_session: Optional["requests.Session"] = None
+        self._sms_client: Optional["SmsClient"] = None
+
+    def __enter__(self) -> "SendSession":
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all connections opened by the session."""
+        for smtp_server in self._smtp_connections.values():
+            _close_smtp(smtp_server)
+        self._smtp_connections.clear()
+
+        # the SMS client sends requests using the HTTP session, so closing the session closes its connections too
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+        self._sms_client = None
+
+    def _get_http_session(self) -> "requests.Session":
+        """Get the HTTP session used for Pushover and Azure SMS requests, creating it on first use."""
+        if self._http_session is None:
+            from ._http import create_session
+
+            self._http_session = create_session()
+
+        return self._http_session
+
+    def send_email(
+        self,
+        smtp_host: str,
+        sender: str,
+        password: str,
+        recipients: Union[str, list[str]],
+        body: str,
+        subject: Optional[str] = None,
+        smtp_port: Optional[int] = 465,
+    ) -> None:
+        """Send simple messages to email, reusing the session's connection to the SMTP server."""
+        key = (smtp_host, smtp_port, sender)
+
+        # connect and login the first time sending from this sender through this server
+        smtp_server = self._smtp_connections.get(key)
+        if smtp_server is None:
+            smtp_server = _connect_smtp(smtp_host, smtp_port, sender, password)
+            self._smtp_connections[key] = smtp_server
+
+        try:
+            _send_email_message(smtp_server, sender, recipients, body, subject)
+
+        # if the server closed the connection since the last send, reconnect and try once more
+        except smtplib.SMTPServerDisconnected:
+            _close_smtp(smtp_server)
+            smtp_server = _connect_smtp(smtp_host, smtp_port, sender, password)
+            self._smtp_connections[key] = smtp_server
+            _send_email_message(smtp_server, sender, recipients, body, subject)
+
+    def send_pushover(
+        self,
+        message: str,
+        api_token: Optional[str] = None,
+        user_key: Optional[str] = None,
+    ) -> "requests.Response":
+        """Send notifications using `Pushover <https://pushover.net>`_, reusing the session's HTTP connection."""
+        return _post_pushover_message(
+            self._get_http_session(), message, api_token, user_key
+        )
+
+    def send_sms(
+        self, body: str, recipients: Optional[Union[str, list[str]]] = None
+    ) -> "list[SmsSendResult]":
+        """Send text messages to phone numbers using Azure Communication Services, reusing the session's client."""
+        # format the phone numbers to send to
+        recipients = _get_sms_recipients(recipients)
+
+        # create the client the first time sending a text message
+        if self._sms_client is None:
+            self._sms_client = _create_sms_client(self._get_http_session())
+
+        return _send_sms(self._sms_client, _get_azure_from(), body, recipients)
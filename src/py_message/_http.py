@@ -0,0 +1,45 @@
+"""
+Shared HTTP session used for both Pushover and Azure SMS requests, so all HTTPS connections come from a single pool
+kept alive between sends. This is imported when first needed, so importing the package does not import ``requests``.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# size connection pools to allow as many requests in flight as the concurrent sending functions use
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session with connection pools sized for concurrent sends, and retries for Pushover requests."""
+    session = requests.Session()
+
+    # Azure SMS requests go through azure-core, which retries requests itself
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE),
+    )
+
+    # Pushover requests retry rate limiting and server errors in the adapter, reusing the same connection
+    session.mount(
+        "https://api.pushover.net/",
+        HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST"],
+                raise_on_status=False,
+            ),
+        ),
+    )
+
+    return session
+
+
+# session shared by the module level sending functions
+SESSION = create_session()
@@ -4,8 +4,11 @@ easily be modified to support any testing framework.
 """
 
 from pathlib import Path
+import smtplib
 import sys
 
+import pytest
+
 # from dotenv import find_dotenv, load_dotenv
 
 # get paths to useful resources - notably where the src directory is
@@ -21,6 +24,429 @@ dir_src = dir_prj / 'src'
 sys.path.insert(0, str(dir_src))
 import py_message
 
+
+class StubSMTP:
+    """Stand-in for ``smtplib.SMTP_SSL`` recording logins and sent messages, which can be set to fail."""
+
+    def __init__(self, host, port):
+        self.logins = 0
+        self.sent = []
+        self.closed = False
+        self.fail_noop = False
+        self.fail_send = False
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def noop(self):
+        if self.fail_noop:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return 250, b"OK"
+
+    def sendmail(self, sender, recipients, msg):
+        if self.fail_send:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append((recipients, msg))
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def smtp_connections(monkeypatch):
+    """Replace ``smtplib.SMTP_SSL`` with a stub, providing the list of connections made."""
+    connections = []
+
+    def connect(host, port):
+        connections.append(StubSMTP(host, port))
+        return connections[-1]
+
+    monkeypatch.setattr(smtplib, "SMTP_SSL", connect)
+    py_message._close_smtp_pool()
+    yield connections
+    py_message._close_smtp_pool()
+
+
+def send_test_email(body="Test Py-Message Email"):
+    py_message.send_email(
+        "smtp.example.com", "me@example.com", "password", "you@example.com", body
+    )
+
+
+def test_send_email_reuses_pooled_connection(smtp_connections):
+    send_test_email()
+    send_test_email()
+
+    assert len(smtp_connections) == 1
+    assert smtp_connections[0].logins == 1
+    assert len(smtp_connections[0].sent) == 2
+
+
+def test_send_email_retires_connection_after_max_messages(
+    smtp_connections, monkeypatch
+):
+    monkeypatch.setattr(py_message, "_SMTP_MAX_MESSAGES", 2)
+
+    for _ in range(3):
+        send_test_email()
+
+    assert len(smtp_connections) == 2
+    assert smtp_connections[0].closed
+    assert [len(conn.sent) for conn in smtp_connections] == [2, 1]
+
+
+def test_send_email_many_retires_connection_mid_batch(smtp_connections, monkeypatch):
+    monkeypatch.setattr(py_message, "_SMTP_MAX_MESSAGES", 2)
+
+    py_message.send_email_many(
+        "smtp.example.com",
+        "me@example.com",
+        "password",
+        [("you@example.com", f"Body {idx}", None) for idx in range(5)],
+    )
+
+    assert [len(conn.sent) for conn in smtp_connections] == [2, 2, 1]
+    assert smtp_connections[0].closed and smtp_connections[1].closed
+
+
+def test_send_email_retires_idle_connection(smtp_connections, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(py_message.time, "monotonic", lambda: now[0])
+
+    send_test_email()
+    now[0] += py_message._SMTP_IDLE_TIMEOUT + 1
+    send_test_email()
+
+    assert len(smtp_connections) == 2
+    assert smtp_connections[0].closed
+
+
+def test_send_email_reconnects_when_noop_fails(smtp_connections):
+    send_test_email()
+    smtp_connections[0].fail_noop = True
+    send_test_email()
+
+    assert len(smtp_connections) == 2
+    assert smtp_connections[0].closed
+    assert len(smtp_connections[1].sent) == 1
+
+
+def test_send_email_closes_connection_when_send_fails(smtp_connections):
+    send_test_email()
+    smtp_connections[0].fail_send = True
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        send_test_email()
+
+    assert smtp_connections[0].closed
+    assert not py_message._smtp_pool
+
+
+@pytest.mark.parametrize(
+    "phone_number, expected",
+    [
+        ("(333) 444-5555", "+13334445555"),
+        ("333.444.5555", "+13334445555"),
+        ("1-333-444-5555", "+13334445555"),
+        ("+44 20 7946 0958", "+442079460958"),
+        ("333\u00a0444\u00a05555", "+13334445555"),
+    ],
+)
+def test_validate_phone_number(phone_number, expected):
+    assert py_message._validate_phone_number(phone_number) == expected
+
+
+@pytest.mark.parametrize("phone_number", ["abcdefghij", "444-5555", "1234567890123"])
+def test_validate_phone_number_rejects_invalid(phone_number):
+    with pytest.raises(ValueError):
+        py_message._validate_phone_number(phone_number)
+
+
+def test_validate_phone_numbers_matches_single():
+    phone_numbers = [
+        "(333) 444-5555",
+        "1-333-444-5555",
+        "+44 20 7946 0958",
+        "333\u00a0444\u00a05555",
+    ]
+
+    assert py_message._validate_phone_numbers(phone_numbers) == [
+        py_message._validate_phone_number(ph) for ph in phone_numbers
+    ]
+
+    with pytest.raises(ValueError):
+        py_message._validate_phone_numbers(["(333) 444-5555", "abcdefghij"])
+
+
+@pytest.mark.parametrize("subject", [None, "Test Py-Message Email"])
+@pytest.mark.parametrize(
+    "body", ["Single line", "First line\nSecond line", "First line\r\nSecond line\r\n"]
+)
+def test_build_simple_email_matches_mime(body, subject):
+    args = ("me@example.com", "you@example.com, them@example.com", body, subject)
+
+    assert py_message._build_simple_email(*args) == py_message._build_mime_email(*args)
+
+
+@pytest.mark.parametrize("length", [60, 74, 75, 120])
+def test_build_simple_email_matches_mime_for_header_length(length):
+    to = ", ".join(["you@example.com"] * 10)[:length]
+    args = ("me@example.com", to, "Body", None)
+    simple = py_message._build_simple_email(*args)
+
+    assert simple is None or simple == py_message._build_mime_email(*args)
+
+
+@pytest.mark.parametrize(
+    "body, subject",
+    [
+        ("Non-ASCII body ✓", None),
+        ("Body", "Non-ASCII subject ✓"),
+        ("Body", "Subject\r\nBcc: them@example.com"),
+        ("Body", "Subject\nBcc: them@example.com"),
+    ],
+)
+def test_build_simple_email_falls_back(body, subject):
+    assert (
+        py_message._build_simple_email(
+            "me@example.com", "you@example.com", body, subject
+        )
+        is None
+    )
+
+
+def test_send_session_reuses_and_closes_connections(smtp_connections):
+    with py_message.SendSession() as session:
+        for host in ["smtp.example.com", "smtp.example.com", "smtp.example.org"]:
+            session.send_email(
+                host, "me@example.com", "password", "you@example.com", "Body"
+            )
+
+        assert len(smtp_connections) == 2
+        assert [conn.logins for conn in smtp_connections] == [1, 1]
+        assert [len(conn.sent) for conn in smtp_connections] == [2, 1]
+
+    assert all(conn.closed for conn in smtp_connections)
+
+
+def test_send_session_reconnects_after_disconnect(smtp_connections):
+    with py_message.SendSession() as session:
+        session.send_email(
+            "smtp.example.com", "me@example.com", "password", "you@example.com", "Body"
+        )
+        smtp_connections[0].fail_send = True
+        session.send_email(
+            "smtp.example.com", "me@example.com", "password", "you@example.com", "Body"
+        )
+
+        assert len(smtp_connections) == 2
+        assert smtp_connections[0].closed
+        assert len(smtp_connections[1].sent) == 1
+
+    assert smtp_connections[1].closed
+
+
+def test_send_session_close_releases_http_and_sms(monkeypatch):
+    class StubHTTPSession:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class StubSmsClient:
+        def send(self, from_, to, message):
+            return []
+
+    http_session = StubHTTPSession()
+    monkeypatch.setattr(
+        py_message, "_create_sms_client", lambda session: StubSmsClient()
+    )
+    monkeypatch.setattr(py_message, "_get_azure_from", lambda: "+18005551234")
+
+    session = py_message.SendSession()
+    session._http_session = http_session
+    session.send_sms("Body", "3334445555")
+    session.close()
+
+    assert http_session.closed
+    assert session._http_session is None
+    assert session._sms_client is None
+
+
+def send_pushover_many_to_server(monkeypatch, replies, messages):
+    """
+    Send messages with ``send_pushover_many`` to a local server, which answers with each ``(status, body,
+    content_type)`` in ``replies`` in turn before echoing the message back.
+    """
+    web = pytest.importorskip("aiohttp.web")
+    import asyncio
+
+    replies = list(replies)
+    requests_seen = []
+
+    async def handle(request):
+        data = await request.post()
+        requests_seen.append(data["message"])
+        if replies:
+            status, body, content_type = replies.pop(0)
+            return web.Response(status=status, text=body, content_type=content_type)
+        return web.json_response({"status": 1, "message": data["message"]})
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        monkeypatch.setattr(py_message, "_PUSHOVER_URL", f"http://127.0.0.1:{port}/")
+        try:
+            return await py_message.send_pushover_many(
+                messages, api_token="token", user_key="user", max_concurrency=1
+            )
+        finally:
+            await runner.cleanup()
+
+    monkeypatch.setattr(py_message, "_PUSHOVER_BACKOFF", 0)
+    return asyncio.run(main()), requests_seen
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_send_pushover_many_retries_then_succeeds(monkeypatch, status):
+    responses, requests_seen = send_pushover_many_to_server(
+        monkeypatch, [(status, "{}", "application/json")] * 2, ["Retried"]
+    )
+
+    assert responses == [{"status": 1, "message": "Retried"}]
+    assert len(requests_seen) == 3
+
+
+@pytest.mark.parametrize(
+    "replies",
+    [
+        [(502, "<html>Bad Gateway</html>", "text/html")] * 4,
+        [(400, "", "text/plain")],
+    ],
+)
+def test_send_pushover_many_handles_non_json_errors(monkeypatch, replies):
+    responses, _ = send_pushover_many_to_server(
+        monkeypatch, replies, ["Failed", "Sent"]
+    )
+
+    assert responses[0]["status"] == 0
+    assert responses[0]["error"]
+    assert responses[1] == {"status": 1, "message": "Sent"}
+
+
+def test_send_pushover_many_threaded_handles_non_json_errors(monkeypatch):
+    pytest.importorskip("requests")
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            data = parse_qs(
+                self.rfile.read(int(self.headers["Content-Length"])).decode()
+            )
+            message = data["message"][0]
+            if message == "Failed":
+                status, body = 503, b"<html>Service Unavailable</html>"
+            else:
+                status, body = 200, f'{{"status": 1, "message": "{message}"}}'.encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        py_message, "_PUSHOVER_URL", f"http://127.0.0.1:{server.server_port}/"
+    )
+
+    try:
+        responses = py_message.send_pushover_many_threaded(
+            ["Failed", "Sent"], api_token="token", user_key="user"
+        )
+    finally:
+        server.shutdown()
+
+    assert [res.status_code for res in responses] == [503, 200]
+
+
+class StubSmsClient:
+    """Stand-in for ``SmsClient`` recording the size of each batch sent and the thread sending it."""
+
+    def __init__(self):
+        self.batches = []
+
+    def send(self, from_, to, message):
+        import threading
+        from types import SimpleNamespace
+
+        self.batches.append((len(to), threading.current_thread()))
+        return [
+            SimpleNamespace(successful=True, to=ph, error_message=None) for ph in to
+        ]
+
+
+@pytest.fixture
+def sms_client(monkeypatch):
+    """Replace the cached Azure SMS client and sending number with a stub."""
+    client = StubSmsClient()
+    monkeypatch.setattr(py_message, "_sms_client", client)
+    monkeypatch.setattr(py_message, "_azure_from", "+18005551234")
+    return client
+
+
+SMS_RECIPIENTS = [f"333444{idx:04d}" for idx in range(250)]
+
+
+def test_send_sms_sends_batches_concurrently(sms_client):
+    import threading
+
+    responses = py_message.send_sms("Body", SMS_RECIPIENTS)
+
+    assert len(responses) == 250
+    assert sorted(size for size, _ in sms_client.batches) == [50, 100, 100]
+    assert all(
+        thread is not threading.main_thread() for _, thread in sms_client.batches
+    )
+
+
+def test_send_sms_sends_batches_in_turn_inside_running_loop(sms_client):
+    import asyncio
+    import threading
+
+    async def main():
+        return py_message.send_sms("Body", SMS_RECIPIENTS)
+
+    responses = asyncio.run(main())
+
+    assert len(responses) == 250
+    assert [size for size, _ in sms_client.batches] == [100, 100, 50]
+    assert all(thread is threading.main_thread() for _, thread in sms_client.batches)
+
+
+def test_send_sms_async_sends_batches(sms_client):
+    import asyncio
+
+    responses = asyncio.run(py_message.send_sms_async("Body", SMS_RECIPIENTS))
+
+    assert [resp.to for resp in responses] == py_message._validate_phone_numbers(
+        SMS_RECIPIENTS
+    )
+    assert sorted(size for size, _ in sms_client.batches) == [50, 100, 100]
+
+
 def test_send_sms():
 
     message = "Test Py-Message SMS"